@@ -15,11 +15,25 @@ from .api.models import LogLevel
 # Initialize the global logger manager
 _manager = LoggerManager()
 
+# Importing .logger bound the submodule here; drop it so that the
+# backward compatible ``logger`` attribute goes through __getattr__ below
+globals().pop('logger', None)
+
 # Backward compatibility exports
-logger = _manager.get_logger()
 event = Event()
 config = config_module
 
+
+def __getattr__(name: str):
+    """Resolve ``baselog.logger`` on first access instead of at import time."""
+    if name == 'logger':
+        return _manager.get_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    return sorted([*globals(), 'logger'])
+
 # Public API Functions
 def configure(api_key: Optional[str] = None, config: Optional[APIConfig] = None, **kwargs) -> None:
     """
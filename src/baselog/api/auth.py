@@ -85,6 +85,17 @@ class AuthManager:
             'User-Agent': 'baselog-python-client/1.0'
         }
 
+    def current_token(self) -> str:
+        """Return the credential currently used for authentication.
+
+        Callers can compare this value to detect key rotation and rebuild
+        any headers they derived from get_auth_headers().
+
+        Returns:
+            The active API key
+        """
+        return self.api_key
+
     def get_masked_api_key(self) -> str:
         """Return a masked version of API key for safe logging/display.
 
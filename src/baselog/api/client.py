@@ -1,14 +1,100 @@
+import asyncio
+import atexit
 import logging
 import json
-from typing import Dict, Any, Optional
+import os
+import threading
+import uuid
+import weakref
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
 import httpx
 import tenacity
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
 from .models import LogModel, APIResponse, LogResponse, EventModel
-from .auth import AuthManager
-from .config import APIConfig, Timeouts, RetryStrategy, load_config, Environment
-from .exceptions import APIError, APIAuthenticationError, APITimeoutError
+from .config import APIConfig, load_config
+from .exceptions import APIError, APIAuthenticationError, APIPartialBatchError, APITimeoutError
+
+
+# HTTP clients shared by APIClients running in the same event loop, keyed by the
+# loop's id, base URL and timeouts, so that clients talking to the same backend
+# reuse one connection pool. Loops are only held weakly; entries whose loop has
+# been collected or closed are dropped on the next registration.
+_CLIENTS: Dict[Tuple, httpx.AsyncClient] = {}
+_CLIENT_REFS: Dict[Tuple, int] = {}
+_CLIENT_LOOPS: Dict[Tuple, weakref.ref] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _prune_dead_loop_clients() -> None:
+    """Forget shared clients whose event loop is gone; call with _CLIENTS_LOCK held."""
+    for key, loop_ref in list(_CLIENT_LOOPS.items()):
+        loop = loop_ref()
+        if loop is None or loop.is_closed():
+            _CLIENTS.pop(key, None)
+            _CLIENT_REFS.pop(key, None)
+            del _CLIENT_LOOPS[key]
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Encode a request body as JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(content: bytes) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+# Random bytes for correlation IDs, drawn from the OS in blocks so that
+# generating an ID does not cost one urandom syscall per log.
+_ID_POOL_SIZE = 1024
+_id_pool = iter(())
+
+
+def _next_correlation_id() -> str:
+    """Return a random UUID4 string taken from the pre-generated pool."""
+    global _id_pool
+    raw = next(_id_pool, None)
+    if raw is None:
+        buf = os.urandom(16 * _ID_POOL_SIZE)
+        _id_pool = iter([buf[i:i + 16] for i in range(0, len(buf), 16)])
+        raw = next(_id_pool)
+    return str(uuid.UUID(bytes=raw, version=4))
+
+
+def _reset_id_pool() -> None:
+    """Discard pooled bytes so a forked child never reuses its parent's IDs."""
+    global _id_pool
+    _id_pool = iter(())
+
+
+os.register_at_fork(after_in_child=_reset_id_pool)
+
+
+@atexit.register
+def _close_shared_clients() -> None:
+    """Close any shared HTTP client still open at interpreter exit."""
+    with _CLIENTS_LOCK:
+        clients = list(_CLIENTS.values())
+        _CLIENTS.clear()
+        _CLIENT_REFS.clear()
+        _CLIENT_LOOPS.clear()
+
+    for client in clients:
+        try:
+            asyncio.run(client.aclose())
+        except Exception:
+            pass
 
 
 class APIClient:
@@ -19,6 +105,10 @@ class APIClient:
     and retry logic for resilient API communications.
     """
 
+    # Endpoint paths, resolved against the HTTP client's base_url
+    _logs_url = "/projects/logs"
+    _logs_batch_url = "/projects/logs/batch"
+
     # Retry configuration for all API calls
     _retry_config = {
         'wait': tenacity.wait_exponential(multiplier=1, min=4, max=10),
@@ -42,18 +132,51 @@ class APIClient:
         self.config = config or load_config()
         self.auth_manager = self.config.create_auth_manager()
         self.logger = logging.getLogger(__name__)
+        self._batch_supported = True
+        self._cached_headers: Optional[Dict[str, str]] = None
+        self._cached_headers_token: Optional[str] = None
 
         # Setup HTTP client with connection pooling and timeout configuration
         self._setup_http_client()
 
-        # Setup retry strategy
-        self._setup_retry_strategy()
-
     def _setup_http_client(self):
-        """Setup the underlying HTTP client with connection pooling and timeouts."""
-        timeout_config = self.config.timeouts
+        """
+        Attach the HTTP client for this configuration, creating it on first use.
 
-        self.client = httpx.AsyncClient(
+        httpx connection pools are bound to the event loop that drives them, so
+        clients are only shared between APIClients created in the same running
+        loop. An APIClient created outside a loop gets a private HTTP client.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        self._client_released = False
+        if loop is None:
+            self._client_key: Optional[Tuple] = None
+            self.client = self._create_http_client()
+            return
+
+        key = (id(loop), self.config.base_url, *self.config.timeouts.to_dict().values())
+        with _CLIENTS_LOCK:
+            _prune_dead_loop_clients()
+            client = _CLIENTS.get(key)
+            if client is None or _CLIENT_LOOPS[key]() is not loop:
+                # New key, or a dead loop's id was reused by this one
+                client = self._create_http_client()
+                _CLIENTS[key] = client
+                _CLIENT_REFS[key] = 0
+                _CLIENT_LOOPS[key] = weakref.ref(loop)
+            _CLIENT_REFS[key] += 1
+
+        self._client_key = key
+        self.client = client
+
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """Build an HTTP client with connection pooling and the configured timeouts."""
+        timeout_config = self.config.timeouts
+        return httpx.AsyncClient(
             base_url=self.config.base_url,
             timeout=httpx.Timeout(
                 connect=timeout_config.connect,
@@ -62,30 +185,41 @@ class APIClient:
                 pool=timeout_config.pool
             ),
             limits=httpx.Limits(
-                max_keepalive_connections=20,
-                max_connections=100
+                max_keepalive_connections=100,
+                max_connections=1000,
+                keepalive_expiry=75.0  # Match common server idle timeouts (nginx)
             ),
-            http1=True
+            # Negotiate HTTP/2 via ALPN so concurrent log posts share one
+            # connection; HTTP/1.1 stays enabled for servers without h2.
+            http1=True,
+            http2=True
         )
 
-    def _setup_retry_strategy(self):
-        """Setup retry strategy using tenacity."""
-        retry_config = self.config.retry_strategy
+    def _release_http_client(self) -> bool:
+        """
+        Drop this instance's reference to its HTTP client.
 
-        self.retry_strategy = tenacity.Retrying(
-            wait=tenacity.wait_exponential(
-                multiplier=retry_config.backoff_factor,
-                min=1.0,
-                max=60.0
-            ),
-            stop=tenacity.stop_after_attempt(retry_config.max_attempts),
-            retry=tenacity.retry_if_exception_type((
-                httpx.TimeoutException,
-                httpx.NetworkError,
-                httpx.ConnectError
-            )),
-            reraise=True
-        )
+        Returns:
+            True if this was the last reference and the client should be closed
+        """
+        with _CLIENTS_LOCK:
+            if self._client_released:
+                return False
+            self._client_released = True
+
+            key = self._client_key
+            if key is None or _CLIENTS.get(key) is not self.client:
+                # Private client, or the registry was reset underneath us
+                return True
+
+            _CLIENT_REFS[key] -= 1
+            if _CLIENT_REFS[key] > 0:
+                return False
+
+            del _CLIENTS[key]
+            del _CLIENT_REFS[key]
+            del _CLIENT_LOOPS[key]
+            return True
 
     async def send_log(self, log_data: LogModel) -> APIResponse:
         """
@@ -113,16 +247,14 @@ class APIClient:
         # Serialize to dict, excluding unset optionals
         json_data = self._serialize_log_model(log_data)
 
-        # 2. URL Construction
-        url = f"{self.config.base_url}/projects/logs"
-
-        # 3. Execute with retry logic
+        # 2. Execute with retry logic
         try:
-            response = await self._send_with_retry(url, json_data)
+            response = await self._send_with_retry(self._logs_url, json_data)
 
-            # 4. Response Handling
-            response_data = response.json()
+            # 3. Response Handling
+            response_data = _json_loads(response.content)
             request_id = response.headers.get('X-Request-ID')
+            timestamp = datetime.now(timezone.utc).isoformat()
 
             # Convert to LogResponse if needed
             log_response = LogResponse(
@@ -130,7 +262,7 @@ class APIClient:
                 message="Log created successfully",
                 data=response_data,
                 request_id=request_id,
-                timestamp=datetime.now(timezone.utc).isoformat(),
+                timestamp=timestamp,
                 correlation_id=log_data.correlation_id
             )
 
@@ -143,28 +275,11 @@ class APIClient:
                 success=True,
                 data=log_response,
                 request_id=request_id,
-                timestamp=datetime.now(timezone.utc).isoformat()
+                timestamp=timestamp
             )
 
         except httpx.HTTPStatusError as e:
-            # Map HTTP errors to custom exceptions
-            if e.response.status_code in (401, 403):
-                raise APIAuthenticationError(
-                    f"Authentication failed: {e.response.status_code}",
-                    status_code=e.response.status_code
-                )
-            elif e.response.status_code == 429:
-                retry_after = int(e.response.headers.get('Retry-After', 60))
-                raise APIError(
-                    f"Rate limited: {e.response.status_code}",
-                    status_code=e.response.status_code,
-                    retry_after=retry_after
-                )
-            else:
-                raise APIError(
-                    f"API request failed: {e.response.status_code}",
-                    status_code=e.response.status_code
-                )
+            raise self._map_status_error(e)
 
         except httpx.TimeoutException as e:
             raise APITimeoutError(
@@ -178,23 +293,124 @@ class APIClient:
                 original_error=e
             )
 
+    async def send_logs_batch(self, logs: List[LogModel]) -> APIResponse:
+        """
+        Send several log entries in a single POST /projects/logs/batch request.
+
+        If the backend does not expose the batch endpoint (404), the entries are
+        sent one by one through send_log and later batches skip the endpoint.
+
+        Args:
+            logs: LogModel instances to send
+
+        Returns:
+            APIResponse with confirmation of log creation
+
+        Raises:
+            APIError: For API-related errors
+            APIAuthenticationError: For authentication failures (401, 403)
+            APITimeoutError: For timeout-related errors
+            ValueError: For invalid input validation
+        """
+        if not logs:
+            raise ValueError("At least one LogModel is required")
+
+        if not self._batch_supported:
+            return await self._send_logs_individually(logs)
+
+        for log_data in logs:
+            if not log_data.message:
+                raise ValueError("Message is required for LogModel")
+            if not log_data.correlation_id:
+                log_data.correlation_id = self._generate_correlation_id()
+
+        json_data = {"logs": [self._serialize_log_model(log_data) for log_data in logs]}
+        try:
+            response = await self._send_with_retry(self._logs_batch_url, json_data)
+
+            response_data = _json_loads(response.content)
+            request_id = response.headers.get('X-Request-ID')
+
+            self.logger.info(f"Batch of {len(logs)} logs sent with request_id {request_id}")
+
+            return APIResponse(
+                success=True,
+                data=response_data,
+                request_id=request_id,
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                message=f"{len(logs)} logs created successfully"
+            )
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                self.logger.info("Batch endpoint not available, falling back to single log requests")
+                self._batch_supported = False
+                return await self._send_logs_individually(logs)
+            raise self._map_status_error(e)
+
+        except httpx.TimeoutException as e:
+            raise APITimeoutError(
+                f"Request timeout: {str(e)}",
+                timeout_type="request"
+            )
+
+        except httpx.RequestError as e:
+            raise APIError(
+                f"Request error: {str(e)}",
+                original_error=e
+            )
+
+    async def _send_logs_individually(self, logs: List[LogModel]) -> APIResponse:
+        """
+        Send each log through send_log and aggregate the responses.
+
+        Raises:
+            APIPartialBatchError: If a log fails after earlier ones were delivered;
+                its sent attribute is the index of the first unsent log
+        """
+        responses = []
+        for index, log_data in enumerate(logs):
+            try:
+                responses.append(await self.send_log(log_data))
+            except Exception as e:
+                if index == 0:
+                    raise
+                raise APIPartialBatchError(
+                    f"Sent {index} of {len(logs)} logs: {e}",
+                    sent=index,
+                    original_error=e
+                ) from e
+        return APIResponse(
+            success=True,
+            data=responses,
+            request_id=None,
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            message=f"{len(logs)} logs created successfully"
+        )
+
+    def _map_status_error(self, e: httpx.HTTPStatusError) -> APIError:
+        """Map an HTTP status error to the matching custom exception."""
+        if e.response.status_code in (401, 403):
+            return APIAuthenticationError(
+                f"Authentication failed: {e.response.status_code}",
+                status_code=e.response.status_code
+            )
+        elif e.response.status_code == 429:
+            retry_after = int(e.response.headers.get('Retry-After', 60))
+            return APIError(
+                f"Rate limited: {e.response.status_code}",
+                status_code=e.response.status_code,
+                retry_after=retry_after
+            )
+        else:
+            return APIError(
+                f"API request failed: {e.response.status_code}",
+                status_code=e.response.status_code
+            )
+
     def _serialize_log_model(self, log_data: LogModel) -> Dict[str, Any]:
         """Serialize LogModel to dict excluding unset optionals."""
-        if hasattr(log_data, 'model_dump'):
-            return log_data.model_dump(exclude_unset=True)
-        elif hasattr(log_data, 'dict'):
-            return log_data.dict(exclude_unset=True)
-        else:
-            # Fallback manual serialization
-            result = {
-                'level': log_data.level.value if hasattr(log_data.level, 'value') else log_data.level,
-                'message': log_data.message,
-            }
-            if log_data.category is not None:
-                result['category'] = log_data.category
-            if log_data.tags:
-                result['tags'] = log_data.tags
-            return result
+        return log_data._serialize()
 
     @tenacity.retry(**_retry_config)
     async def _send_with_retry(self, url: str, json_data: Dict[str, Any]) -> httpx.Response:
@@ -202,7 +418,7 @@ class APIClient:
         Internal method to send request with retry logic.
 
         Args:
-            url: Target URL for the request
+            url: Target path, relative to the configured base_url
             json_data: JSON data to send in the request body
 
         Returns:
@@ -213,28 +429,29 @@ class APIClient:
             httpx.TimeoutException: For timeout errors
             httpx.RequestError: For other request errors
         """
-        # Get current auth headers
-        current_headers = self.auth_manager.get_auth_headers()
-        request_headers = {
-            **current_headers,
-            'Content-Type': 'application/json'
-        }
-
-        timeout = getattr(self.config.timeouts, 'read', 30.0)
         response = await self.client.post(
             url,
-            json=json_data,
-            headers=request_headers,
-            timeout=timeout
+            content=_json_dumps(json_data),
+            headers=self._get_request_headers()
         )
 
         response.raise_for_status()
         return response
 
+    def _get_request_headers(self) -> Dict[str, str]:
+        """Return request headers, rebuilding them only when the API key rotates."""
+        token = self.auth_manager.current_token()
+        if self._cached_headers is None or token != self._cached_headers_token:
+            self._cached_headers = {
+                **self.auth_manager.get_auth_headers(),
+                'Content-Type': 'application/json'
+            }
+            self._cached_headers_token = token
+        return self._cached_headers
+
     def _generate_correlation_id(self) -> str:
         """Generate a unique correlation ID for the log entry."""
-        import uuid
-        return str(uuid.uuid4())
+        return _next_correlation_id()
 
     async def send_event(self, event_data: EventModel) -> APIResponse:
         """
@@ -289,7 +506,7 @@ class APIClient:
     # @tenacity.retry(**self._retry_config)
     # async def send_event(self, event_data: EventModel) -> APIResponse:
     #     """Full implementation for future event submission."""
-    #     url = f"{self.config.base_url}/projects/events"
+    #     url = "/projects/events"
     #     json_data = event_data.model_dump(exclude_unset=True)
     #
     #     response = await self._send_with_retry(url, json_data)
@@ -310,8 +527,13 @@ class APIClient:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit - cleanup resources."""
-        await self.client.aclose()
+        await self.close()
 
     async def close(self):
-        """Explicitly close the HTTP client."""
-        await self.client.aclose()
\ No newline at end of file
+        """
+        Release the shared HTTP client.
+
+        The underlying connection pool is closed once no other APIClient uses it.
+        """
+        if self._release_http_client():
+            await self.client.aclose()
\ No newline at end of file
@@ -73,4 +73,12 @@ class APINetworkError(APIError):
     """Raised for network-related errors."""
 
     def __init__(self, message: str, original_error: Exception = None):
-        super().__init__(message, original_error=original_error)
\ No newline at end of file
+        super().__init__(message, original_error=original_error)
+
+
+class APIPartialBatchError(APIError):
+    """Raised when a batch sent entry by entry fails after delivering some entries."""
+
+    def __init__(self, message: str, sent: int, original_error: Exception = None):
+        self.sent = sent
+        super().__init__(message, original_error=original_error)
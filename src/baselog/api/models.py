@@ -37,11 +37,15 @@ class LogLevel(str, Enum):
     def from_string(cls, value: str) -> 'LogLevel':
         """Convert string to LogLevel, case-insensitive"""
         try:
-            return cls(value.lower())
-        except ValueError:
+            return _LEVEL_CACHE[value.lower()]
+        except KeyError:
             raise InvalidLogLevelError(value, [e.value for e in cls])
 
-@dataclass
+
+# Lookup table for LogLevel.from_string, built once at import time
+_LEVEL_CACHE: Dict[str, LogLevel] = {e.value: e for e in LogLevel}
+
+@dataclass(slots=True)
 class LogModel:
     level: LogLevel
     message: str
@@ -50,13 +54,28 @@ class LogModel:
     correlation_id: Optional[str] = None
 
     def __post_init__(self):
-        if isinstance(self.level, str):
+        # LogLevel is a str subclass, so check for it first to skip the lookup
+        if isinstance(self.level, LogLevel):
+            pass
+        elif isinstance(self.level, str):
             self.level = LogLevel.from_string(self.level)
-        elif not isinstance(self.level, LogLevel):
+        else:
             raise InvalidLogLevelError(str(self.level), [e.value for e in LogLevel])
         if not self.message:
             raise MissingMessageError()
 
+    def _serialize(self) -> Dict[str, Any]:
+        """Serialize to a request payload, leaving out unset optionals."""
+        result = {
+            'level': self.level.value,
+            'message': self.message,
+        }
+        if self.category is not None:
+            result['category'] = self.category
+        if self.tags:
+            result['tags'] = self.tags
+        return result
+
 @dataclass
 class EventModel:
     event_type: str
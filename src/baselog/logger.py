@@ -1,7 +1,88 @@
 from enum import Enum
 from collections.abc import Sequence
+from functools import partialmethod
 from typing import Optional
+import atexit
 import logging
+import queue
+import threading
+import time
+import weakref
+
+from .api.models import LogModel, LogLevel
+from .api.exceptions import APIPartialBatchError
+
+
+# Maximum number of log entries buffered for the background sender
+_QUEUE_MAXSIZE = 10000
+
+# Seconds to wait at interpreter exit for buffered logs to be sent
+_EXIT_FLUSH_TIMEOUT = 10.0
+
+# Queued by flush() so the sender does not wait out batch_interval
+_FLUSH = object()
+
+# Queued after the last entry to stop the background sender
+_STOP = object()
+
+# Consecutive failed sends after which API mode is bypassed for a while
+_FAILURE_THRESHOLD = 5
+
+# Seconds to log locally once the failure threshold is reached
+_DEGRADED_SECONDS = 30.0
+
+# Severity ordering used for level gating
+_LEVEL_ORDER = {
+    LogLevel.DEBUG: 10,
+    LogLevel.INFO: 20,
+    LogLevel.WARNING: 30,
+    LogLevel.ERROR: 40,
+    LogLevel.CRITICAL: 50,
+}
+
+
+# Loggers whose background sender is running, flushed at interpreter exit
+_LOGGERS: 'weakref.WeakSet[Logger]' = weakref.WeakSet()
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left until a time.monotonic() deadline; None for no deadline."""
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+@atexit.register
+def _flush_loggers() -> None:
+    """Give every live logger one shared _EXIT_FLUSH_TIMEOUT to send its queue."""
+    deadline = time.monotonic() + _EXIT_FLUSH_TIMEOUT
+    for logger in list(_LOGGERS):
+        logger.flush(_remaining(deadline))
+
+
+def _run_sender(logger_ref: 'weakref.ref[Logger]', log_queue: queue.Queue) -> None:
+    """
+    Background sender loop; holds the logger only while it handles a batch.
+
+    Exits on _STOP, or once the logger has been garbage collected.
+    """
+    while True:
+        first = log_queue.get()
+        logger = logger_ref()
+        if logger is None:
+            log_queue.task_done()
+            return
+        if logger._drain(first):
+            return
+        del logger
+
+
+def _stop_sender(log_queue: queue.Queue) -> None:
+    """Wake a sender whose logger was collected so it can exit."""
+    try:
+        log_queue.put_nowait(_STOP)
+    except queue.Full:
+        pass  # The sender finds the logger gone after its next batch
 
 
 class LoggerMode(Enum):
@@ -22,6 +103,9 @@ class Logger:
 
     Supports both remote API logging and local print logging with
     automatic fallback to local logging on API failures.
+
+    In API mode, log calls only enqueue the entry; a background thread
+    sends queued entries in batches, so callers never wait on the network.
     """
 
     def __init__(self, api_key: Optional[str] = None, config: Optional['APIConfig'] = None):
@@ -40,6 +124,13 @@ class Logger:
         self._sync_client: Optional['SyncAPIClient'] = None
         self._config: Optional['APIConfig'] = None
         self._mode: LoggerMode = LoggerMode.LOCAL  # Default to local mode
+        self._queue: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self._level: LogLevel = LogLevel.DEBUG
+        self._min_level_value: int = _LEVEL_ORDER[LogLevel.DEBUG]
+        self._api_failures = 0
+        self._degraded_until = 0.0
 
         # Setup API client if configuration provided
         if api_key or config:
@@ -61,6 +152,7 @@ class Logger:
             from .sync_client import SyncAPIClient
             self._sync_client = SyncAPIClient(final_config)
             self._config = final_config
+            self._queue = queue.Queue(maxsize=_QUEUE_MAXSIZE)
             self._mode = LoggerMode.API
 
             self.logger.debug(f"Logger configured for API mode with base_url: {final_config.base_url}")
@@ -144,6 +236,26 @@ class Logger:
         """Get current configuration (None for local mode)."""
         return self._config
 
+    @property
+    def level(self) -> LogLevel:
+        """Get the minimum level that is emitted"""
+        return self._level
+
+    def set_level(self, level: LogLevel | str) -> None:
+        """
+        Set the minimum level to emit; calls below it return immediately.
+
+        Args:
+            level: LogLevel member or its case-insensitive name
+
+        Raises:
+            InvalidLogLevelError: If level is not a known log level
+        """
+        if not isinstance(level, LogLevel):
+            level = LogLevel.from_string(level)
+        self._level = level
+        self._min_level_value = _LEVEL_ORDER[level]
+
     def is_api_mode(self) -> bool:
         """Check if logger is in API mode"""
         return self._mode == LoggerMode.API
@@ -188,97 +300,171 @@ class Logger:
         else:
             print(f"{level}: {message}", category, tags)
 
-    def info(
-        self, message: str, *, category: Optional[str] = None, tags: Sequence[str] = []
-    ) -> None:
-        if self.is_api_mode() and self._sync_client:
-            try:
-                from .api.models import LogModel, LogLevel
-                log_data = LogModel(
-                    level=LogLevel.INFO,
-                    message=message,
-                    category=category,
-                    tags=tags
-                )
-                self._sync_client.send_log_sync(log_data)
-            except Exception:
-                # Fallback to local logging on API error
-                self._print_log_locally("INFO", message, category, tags)
-        else:
-            self._print_log_locally("INFO", message, category, tags)
+    def _enqueue(self, log_data: 'LogModel') -> None:
+        """
+        Queue a log entry for the background sender, starting it on first use.
 
-    def debug(
-        self, message: str, *, category: Optional[str] = None, tags: Sequence[str] = []
-    ) -> None:
-        if self.is_api_mode() and self._sync_client:
-            try:
-                from .api.models import LogModel, LogLevel
-                log_data = LogModel(
-                    level=LogLevel.DEBUG,
-                    message=message,
-                    category=category,
-                    tags=tags
-                )
-                self._sync_client.send_log_sync(log_data)
-            except Exception:
-                # Fallback to local logging on API error
-                self._print_log_locally("DEBUG", message, category, tags)
-        else:
-            self._print_log_locally("DEBUG", message, category, tags)
+        Raises:
+            queue.Full: If the buffer is full
+        """
+        if self._worker is None:
+            with self._worker_lock:
+                if self._worker is None:
+                    # The sender only holds a weak reference, so an unused
+                    # logger can still be collected
+                    self._worker = threading.Thread(
+                        target=_run_sender, args=(weakref.ref(self), self._queue),
+                        name="baselog-sender", daemon=True
+                    )
+                    self._worker.start()
+                    weakref.finalize(self, _stop_sender, self._queue)
+                    _LOGGERS.add(self)
+        self._queue.put_nowait(log_data)
+
+    def _drain(self, first: object) -> bool:
+        """
+        Send one batch, starting from an item already taken off the queue; runs on the background thread.
 
-    def warning(
-        self, message: str, *, category: Optional[str] = None, tags: Sequence[str] = []
-    ) -> None:
-        if self.is_api_mode() and self._sync_client:
+        A batch is sent once it holds batch_size entries, batch_interval seconds
+        after its first entry arrived, or as soon as flush() or close() asks.
+
+        Returns:
+            True if _STOP was reached and the sender should exit
+        """
+        batch_size = self._config.batch_size
+        batch = [first]
+        deadline = time.monotonic() + self._config.batch_interval
+        while len(batch) < batch_size and batch[-1] is not _FLUSH and batch[-1] is not _STOP:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
             try:
-                from .api.models import LogModel, LogLevel
-                log_data = LogModel(
-                    level=LogLevel.WARNING,
-                    message=message,
-                    category=category,
-                    tags=tags
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        entries = [item for item in batch if item is not _FLUSH and item is not _STOP]
+        try:
+            sent = self._send_batch(entries) if entries else 0
+            # Fallback to local logging on API error, for entries not yet delivered
+            for log_data in entries[sent:]:
+                self._print_log_locally(
+                    log_data.level.name, log_data.message, log_data.category, log_data.tags
                 )
-                self._sync_client.send_log_sync(log_data)
-            except Exception:
-                # Fallback to local logging on API error
-                self._print_log_locally("WARNING", message, category, tags)
-        else:
-            self._print_log_locally("WARNING", message, category, tags)
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+        return batch[-1] is _STOP
 
-    def error(
-        self, message: str, *, category: Optional[str] = None, tags: Sequence[str] = []
-    ) -> None:
-        if self.is_api_mode() and self._sync_client:
+    def _send_batch(self, batch: list['LogModel']) -> int:
+        """
+        Send a batch to the API, tracking consecutive failures.
+
+        After _FAILURE_THRESHOLD failures in a row, sending is suspended
+        for _DEGRADED_SECONDS so log calls take the local path directly.
+
+        Returns:
+            Number of leading entries delivered; the rest should be logged locally
+        """
+        if time.monotonic() < self._degraded_until:
+            return 0
+        try:
+            self._sync_client.send_logs_batch_sync(batch)
+        except Exception as e:
+            self._api_failures += 1
+            if self._api_failures >= _FAILURE_THRESHOLD:
+                self._degraded_until = time.monotonic() + _DEGRADED_SECONDS
+                self._api_failures = 0
+            return e.sent if isinstance(e, APIPartialBatchError) else 0
+        self._api_failures = 0
+        return len(batch)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every queued log entry has been handled.
+
+        Args:
+            timeout: Maximum seconds to wait; None waits indefinitely
+
+        Returns:
+            True if the queue was drained, False if the timeout expired first
+        """
+        if self._queue is None:
+            return True
+
+        worker = self._worker
+        if worker is None or not worker.is_alive():
+            # No sender is left to handle what is still queued
+            return not self._queue.unfinished_tasks
+
+        try:
+            self._queue.put_nowait(_FLUSH)
+        except queue.Full:
+            pass  # A full queue fills batches without waiting
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = _remaining(deadline)
+                if remaining == 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = _EXIT_FLUSH_TIMEOUT) -> None:
+        """
+        Send queued log entries, then stop the background sender and close the API client.
+
+        The logger logs locally afterwards. Calling close more than once is safe.
+
+        Args:
+            timeout: Maximum seconds to wait for queued entries; None waits indefinitely
+        """
+        with self._worker_lock:
+            if self._mode != LoggerMode.API:
+                return
+            # New log calls take the local path while the queue drains
+            self._mode = LoggerMode.LOCAL
+            worker = self._worker
+            self._worker = None
+
+        if worker is not None:
+            _LOGGERS.discard(self)
+            # The sender exits once it reaches _STOP, so joining it also
+            # waits for every entry queued before it
+            deadline = None if timeout is None else time.monotonic() + timeout
             try:
-                from .api.models import LogModel, LogLevel
-                log_data = LogModel(
-                    level=LogLevel.ERROR,
-                    message=message,
-                    category=category,
-                    tags=tags
-                )
-                self._sync_client.send_log_sync(log_data)
-            except Exception:
-                # Fallback to local logging on API error
-                self._print_log_locally("ERROR", message, category, tags)
-        else:
-            self._print_log_locally("ERROR", message, category, tags)
+                self._queue.put(_STOP, timeout=_remaining(deadline))
+            except queue.Full:
+                pass
+            worker.join(_remaining(deadline))
+
+        self._sync_client.close()
+        self._sync_client = None
 
-    def critical(
-        self, message: str, *, category: Optional[str] = None, tags: Sequence[str] = []
+    def _emit(
+        self, level: LogLevel, message: str, *, category: Optional[str] = None, tags: Sequence[str] = []
     ) -> None:
-        if self.is_api_mode() and self._sync_client:
+        """Log a message at the given level, falling back to local output."""
+        if _LEVEL_ORDER[level] < self._min_level_value:
+            return
+        if self.is_api_mode() and self._sync_client and time.monotonic() >= self._degraded_until:
             try:
-                from .api.models import LogModel, LogLevel
                 log_data = LogModel(
-                    level=LogLevel.CRITICAL,
+                    level=level,
                     message=message,
                     category=category,
                     tags=tags
                 )
-                self._sync_client.send_log_sync(log_data)
+                self._enqueue(log_data)
             except Exception:
                 # Fallback to local logging on API error
-                self._print_log_locally("CRITICAL", message, category, tags)
+                self._print_log_locally(level.name, message, category, tags)
         else:
-            self._print_log_locally("CRITICAL", message, category, tags)
+            self._print_log_locally(level.name, message, category, tags)
+
+    info = partialmethod(_emit, LogLevel.INFO)
+    debug = partialmethod(_emit, LogLevel.DEBUG)
+    warning = partialmethod(_emit, LogLevel.WARNING)
+    error = partialmethod(_emit, LogLevel.ERROR)
+    critical = partialmethod(_emit, LogLevel.CRITICAL)
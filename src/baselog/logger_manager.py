@@ -59,6 +59,7 @@ class LoggerManager:
             **kwargs: Additional configuration parameters
         """
         with self._lock:
+            previous = self._logger
             try:
                 if config is not None:
                     self._logger = Logger(config=config)
@@ -94,6 +95,10 @@ class LoggerManager:
                 self._configured = False
                 self.logger.warning(f"Configuration failed, using local logger: {e}")
 
+            # Stop the replaced logger's sender so it doesn't outlive it
+            if previous is not None and previous is not self._logger:
+                previous.close()
+
     def is_configured(self) -> bool:
         """
         Check if logger is configured for API usage.
@@ -113,6 +118,8 @@ class LoggerManager:
         forcing re-initialization on next access.
         """
         with self._lock:
+            if self._logger is not None:
+                self._logger.close()
             self._logger = None
             self._configured = False
             self.logger.debug("LoggerManager reset to initial state")
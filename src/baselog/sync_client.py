@@ -1,7 +1,9 @@
 import asyncio
 import concurrent.futures
 import logging
-from typing import Optional
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, List, Optional
 from .api.client import APIClient
 from .api.config import APIConfig
 from .api.models import LogModel, APIResponse
@@ -14,6 +16,8 @@ class SyncAPIClient:
 
     This class handles the async/sync bridge, allowing the logger to use
     synchronous methods while the underlying API client remains async.
+    Every call runs on one event loop owned by this client, which keeps the
+    HTTP client's pooled connections usable from one call to the next.
     """
 
     def __init__(self, config: APIConfig):
@@ -26,6 +30,8 @@ class SyncAPIClient:
         self.config = config
         self._async_client: Optional[APIClient] = None
         self._event_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_finalizer: Optional[weakref.finalize] = None
+        self._loop_lock = threading.Lock()
         self.logger = logging.getLogger(__name__)
 
         # Initialize the async client
@@ -34,12 +40,18 @@ class SyncAPIClient:
     def _setup_async_client(self):
         """Setup the underlying async APIClient."""
         try:
-            self._async_client = APIClient(self.config)
+            # Build it on our own loop so its HTTP client is bound to the loop
+            # that drives it, not to whatever loop the caller happens to run
+            self._async_client = self._run_sync(self._create_async_client)
             self.logger.debug("SyncAPIClient initialized with async APIClient")
         except Exception as e:
             self.logger.error(f"Failed to initialize async client: {e}")
             raise
 
+    async def _create_async_client(self) -> APIClient:
+        """Create the async APIClient inside this client's event loop."""
+        return APIClient(self.config)
+
     def send_log_sync(self, log_data: LogModel) -> APIResponse:
         """
         Synchronous wrapper for sending logs via the async API client.
@@ -58,53 +70,74 @@ class SyncAPIClient:
         if self._async_client is None:
             raise APIError("Async client not initialized")
 
-        return self._handle_sync_log_sending(log_data)
+        return self._run_sync(self._async_client.send_log, log_data)
 
-    def _handle_sync_log_sending(self, log_data: LogModel) -> APIResponse:
+    def send_logs_batch_sync(self, logs: List[LogModel]) -> APIResponse:
         """
-        Handle log sending across different async contexts.
+        Synchronous wrapper for sending a batch of logs via the async API client.
+
+        Args:
+            logs: LogModel instances to send in a single request
+
+        Returns:
+            APIResponse with confirmation of log creation
 
-        This method intelligently handles different scenarios:
-        1. No event loop running
-        2. Event loop already running
-        3. Event loop creation errors
+        Raises:
+            APIError: For API-related errors
+            APIAuthenticationError: For authentication failures
+            APITimeoutError: For timeout-related errors
+        """
+        if self._async_client is None:
+            raise APIError("Async client not initialized")
+
+        return self._run_sync(self._async_client.send_logs_batch, logs)
+
+    def _run_sync(self, method: Callable[..., Awaitable[Any]], *args) -> Any:
+        """
+        Run an async client method to completion from synchronous code.
+
+        Args:
+            method: Async APIClient method to call
+            *args: Arguments passed to the method
+
+        Returns:
+            Result of the API call
         """
         try:
-            # Try to get existing event loop
-            loop = asyncio.get_event_loop()
-
-            if loop.is_running():
-                # We're in an async context - use thread pool
-                return self._send_log_in_async_context(log_data, loop)
-            else:
-                # No running loop - can use asyncio.run
-                return asyncio.run(self._async_client.send_log(log_data))
-        except RuntimeError:
-            # No event loop exists - create new one
-            return asyncio.run(self._async_client.send_log(log_data))
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # No running loop in this thread - drive our own loop directly
+                return self._run_on_own_loop(method, *args)
+            # We're in an async context - use thread pool
+            return self._run_in_async_context(method, *args)
         except Exception as e:
             self.logger.error(f"Failed to send log synchronously: {e}")
             raise
 
-    def _send_log_in_async_context(self, log_data: LogModel, loop: asyncio.AbstractEventLoop) -> APIResponse:
+    def _run_on_own_loop(self, method: Callable[..., Awaitable[Any]], *args) -> Any:
+        """Run an async client method on this client's event loop, creating it on first use."""
+        with self._loop_lock:
+            if self._event_loop is None:
+                self._event_loop = asyncio.new_event_loop()
+                # Close the loop even if this client is dropped without close()
+                self._loop_finalizer = weakref.finalize(self, self._event_loop.close)
+            return self._event_loop.run_until_complete(method(*args))
+
+    def _run_in_async_context(self, method: Callable[..., Awaitable[Any]], *args) -> Any:
         """
-        Handle log sending when already in an async context.
+        Run an async client method when already in an async context.
 
         Args:
-            log_data: LogModel instance
-            loop: Current event loop
+            method: Async APIClient method to call
+            *args: Arguments passed to the method
 
         Returns:
-            APIResponse from the API call
+            Result of the API call
         """
-        import concurrent.futures
-
-        # Use a thread pool to run the async operation
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(
-                asyncio.run,
-                self._async_client.send_log(log_data)
-            )
+        # The caller's loop is busy running us, so drive our loop from a helper thread
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self._run_on_own_loop, method, *args)
             return future.result(timeout=30)  # 30 second timeout
 
     def close(self) -> None:
@@ -115,23 +148,17 @@ class SyncAPIClient:
         """
         if self._async_client:
             try:
-                # Try to close in existing loop first
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # Use thread pool for cleanup
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(
-                            asyncio.run,
-                            self._async_client.close()
-                        )
-                        future.result(timeout=10)
-                else:
-                    asyncio.run(self._async_client.close())
+                self._run_sync(self._async_client.close)
             except Exception as e:
                 self.logger.warning(f"Error closing async client: {e}")
             finally:
                 self._async_client = None
 
+        with self._loop_lock:
+            if self._event_loop is not None:
+                self._loop_finalizer()
+                self._event_loop = None
+
         self.logger.debug("SyncAPIClient closed")
 
     def __enter__(self):
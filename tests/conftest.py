@@ -0,0 +1,130 @@
+"""Shared fixtures for the test suite.
+
+PYTEST_DONT_REWRITE: this module holds no assertions, so pytest skips
+rewriting it on import.
+"""
+import copy
+import pytest
+from unittest.mock import Mock
+
+import baselog
+from baselog.api import client as client_module
+from baselog.api.auth import AuthManager
+from baselog.api.config import APIConfig, Timeouts, RetryStrategy, Environment
+from baselog.api.models import LogModel, EventModel
+from baselog.logger_manager import LoggerManager
+
+from constants import TEST_API_KEY, FIXED_TS
+
+# Validated once at import; tests only read it
+_AUTH_MANAGER = AuthManager(api_key=TEST_API_KEY)
+
+# Stand-ins for the API constructors the Logger resolves at setup time
+_API_CONFIG_CLASS = Mock(name="APIConfig")
+_SYNC_CLIENT_CLASS = Mock(name="SyncAPIClient")
+
+
+@pytest.fixture(scope="session")
+def mock_config():
+    """Create a mock configuration for testing; shared because no test mutates it."""
+    return APIConfig(
+        base_url="https://api.test.com",
+        api_key=TEST_API_KEY,
+        environment=Environment.DEVELOPMENT,
+        timeouts=Timeouts(),
+        retry_strategy=RetryStrategy()
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_auth_manager():
+    """The shared AuthManager for the test API key."""
+    return _AUTH_MANAGER
+
+
+@pytest.fixture
+def log_factory():
+    """Build LogModel instances from test defaults, overridden by keyword."""
+    def _make(**overrides):
+        return LogModel(**{'level': 'info', 'message': 'Test message', **overrides})
+    return _make
+
+
+@pytest.fixture(scope="session")
+def basic_log():
+    """A LogModel shared by tests that only read it; mutating tests use fresh_log."""
+    return LogModel(level='info', message='Test log message')
+
+
+@pytest.fixture(scope="session")
+def log_with_tags():
+    """A LogModel with category and tags, shared by tests that only read it."""
+    return LogModel(level='error', message='error message', category='auth', tags=['security', 'login'])
+
+
+@pytest.fixture
+def fresh_log(basic_log):
+    """A per-test copy of basic_log for tests that modify it, e.g. via send_log."""
+    return copy.copy(basic_log)
+
+
+@pytest.fixture
+def event_factory():
+    """Build EventModel instances from test defaults, overridden by keyword."""
+    def _make(**overrides):
+        return EventModel(**{
+            'event_type': 'user_action',
+            'payload': {'action': 'click'},
+            'timestamp': FIXED_TS,
+            'source_service': 'webapp',
+            **overrides
+        })
+    return _make
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_http_clients():
+    """Give every test a fresh registry of shared HTTP clients."""
+    client_module._CLIENTS.clear()
+    client_module._CLIENT_REFS.clear()
+    client_module._CLIENT_LOOPS.clear()
+    yield
+    client_module._CLIENTS.clear()
+    client_module._CLIENT_REFS.clear()
+    client_module._CLIENT_LOOPS.clear()
+
+
+@pytest.fixture
+def fresh_logger_manager():
+    """A new LoggerManager singleton; the previous instance is restored afterwards."""
+    previous = LoggerManager._instance
+    LoggerManager._instance = None
+    yield LoggerManager()
+    LoggerManager._instance = previous
+
+
+@pytest.fixture
+def patched_api(monkeypatch):
+    """Patch the APIConfig and SyncAPIClient classes used by Logger's API setup.
+
+    Yields (mock_api_config, mock_api_client); tests configure return_value or
+    side_effect on them. The mocks are shared and reset after each test.
+    """
+    monkeypatch.setattr('baselog.api.config.APIConfig', _API_CONFIG_CLASS)
+    monkeypatch.setattr('baselog.sync_client.SyncAPIClient', _SYNC_CLIENT_CLASS)
+    yield _API_CONFIG_CLASS, _SYNC_CLIENT_CLASS
+    _API_CONFIG_CLASS.reset_mock(return_value=True, side_effect=True)
+    _SYNC_CLIENT_CLASS.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def reset_package_manager():
+    """Clear baselog's global manager for one test; its previous logger is restored afterwards."""
+    manager = baselog._manager
+    previous = manager._logger, manager._configured
+    manager._logger, manager._configured = None, False
+    yield manager
+    created = manager._logger
+    manager._logger, manager._configured = previous
+    if created is not None and created is not previous[0]:
+        created.close()
@@ -0,0 +1,8 @@
+"""Plain constants shared by the test modules and conftest."""
+
+from datetime import datetime
+
+TEST_API_KEY = "test-api-key-that-is-at-least-16-characters-long"
+
+# Deterministic timestamp for models built in tests
+FIXED_TS = datetime(2024, 1, 1, 0, 0, 0)
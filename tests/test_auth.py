@@ -8,6 +8,8 @@ from baselog.api.auth import (
     MissingAPIKeyError
 )
 
+pytestmark = pytest.mark.unit
+
 
 class TestAuthManager:
     """Test cases for AuthManager class."""
@@ -89,6 +91,14 @@ class TestAuthManager:
 
         assert headers == expected_headers
 
+    def test_current_token(self):
+        """Test current token tracks the active API key."""
+        auth_manager = AuthManager(api_key="token_test_key_1234567890")
+        assert auth_manager.current_token() == "token_test_key_1234567890"
+
+        auth_manager.api_key = "rotated_test_key_1234567890"
+        assert auth_manager.current_token() == "rotated_test_key_1234567890"
+
     def test_get_masked_api_key(self):
         """Test API key masking."""
         api_key = "test_key_1234567890"
@@ -5,6 +5,8 @@ from unittest.mock import patch
 from baselog.api.config import APIConfig, Environment, Timeouts, RetryStrategy
 from baselog.api.auth import AuthManager, InvalidAPIKeyError
 
+pytestmark = pytest.mark.unit
+
 
 class TestAuthManagerAPIConfigIntegration:
     """Integration tests between AuthManager and APIConfig."""
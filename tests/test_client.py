@@ -1,47 +1,91 @@
+import asyncio
+import copy
+import gc
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
-import sys
-import os
 import httpx
-from datetime import datetime
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import json
+import uuid
+import weakref
 
+from baselog.api import client as client_module
 from baselog.api.client import APIClient
 from baselog.api.config import APIConfig, Timeouts, RetryStrategy, Environment
-from baselog.api.models import LogModel, APIResponse, LogResponse, EventModel
-from baselog.api.auth import AuthManager
+from baselog.api.models import LogResponse
+from baselog.api.exceptions import APIError, APIAuthenticationError, APIPartialBatchError, APITimeoutError
+from baselog.sync_client import SyncAPIClient
+
+from constants import TEST_API_KEY
+
+# The real class, captured before the module-wide patch replaces httpx.AsyncClient
+_ASYNC_CLIENT_SPEC = httpx.AsyncClient
+
+# Canned POST /projects/logs response; tests only read it
+_LOG_RESPONSE_JSON = {'id': 'log123', 'status': 'created'}
+_LOG_RESPONSE_BODY = json.dumps(_LOG_RESPONSE_JSON).encode()
+
+
+@pytest.fixture(scope="module")
+def async_client_class():
+    """Patch httpx.AsyncClient once for the module with a mock spec'd on the real class."""
+    with patch('baselog.api.client.httpx.AsyncClient', spec=_ASYNC_CLIENT_SPEC) as mock_async_client:
+        yield mock_async_client
+
+
+@pytest.fixture(autouse=True)
+def patched_httpx(async_client_class):
+    """Reset the module-wide AsyncClient mock for each test; tests that inspect it take this mock."""
+    async_client_class.reset_mock(return_value=True, side_effect=True)
+    async_client_class.return_value = AsyncMock(spec=_ASYNC_CLIENT_SPEC)
+    return async_client_class
+
+
+@pytest.fixture
+def response_factory():
+    """Build httpx.Response stand-ins restricted to the real Response attributes."""
+    def _make(content=b'{}', headers=None, status_code=200):
+        response = Mock(spec=httpx.Response)
+        response.content = content
+        response.headers = headers if headers is not None else {}
+        response.status_code = status_code
+        return response
+    return _make
+
+
+@pytest.fixture(scope="module")
+def shared_client(mock_config, async_client_class):
+    """One APIClient for tests that only read from it and never send requests."""
+    return APIClient(mock_config)
+
+
+@pytest.fixture
+def client(shared_client):
+    """A per-test copy of shared_client with its own HTTP client mock."""
+    client = copy.copy(shared_client)
+    client.client = AsyncMock(spec=_ASYNC_CLIENT_SPEC)
+    return client
 
 
 class TestAPIClient:
     """Test cases for the APIClient class."""
 
-    @pytest.fixture
-    def mock_config(self):
-        """Create a mock configuration for testing."""
-        return APIConfig(
-            base_url="https://api.test.com",
-            api_key="test-api-key-that-is-at-least-16-characters-long",
-            environment=Environment.DEVELOPMENT,
-            timeouts=Timeouts(),
-            retry_strategy=RetryStrategy()
-        )
-
-    
-    def test_client_initialization_with_config(self, mock_config):
+    @pytest.mark.unit
+    def test_client_initialization_with_config(self, mock_config, mock_auth_manager):
         """Test APIClient initialization with provided config."""
         client = APIClient(mock_config)
 
         assert client.config == mock_config
         assert client.config.base_url == "https://api.test.com"
-        assert client.config.api_key == "test-api-key-that-is-at-least-16-characters-long"
-        assert client.auth_manager is not None
+        assert client.config.api_key == TEST_API_KEY
+        assert client.auth_manager == mock_auth_manager
 
+    @pytest.mark.unit
     def test_client_initialization_without_config(self):
         """Test APIClient initialization without config (creates default config)."""
         with patch('baselog.api.client.load_config') as mock_load_config:
             mock_config = APIConfig(
                 base_url="https://env-config.com",
-                api_key="test-api-key-that-is-at-least-16-characters-long",
+                api_key=TEST_API_KEY,
                 environment=Environment.PRODUCTION,
                 timeouts=Timeouts(),
                 retry_strategy=RetryStrategy()
@@ -54,373 +98,490 @@ class TestAPIClient:
             assert client.auth_manager is not None
             mock_load_config.assert_called_once()
 
-    @patch('baselog.api.client.httpx.AsyncClient')
-    def test_setup_http_client(self, mock_async_client, mock_config):
+    @pytest.mark.unit
+    def test_setup_http_client(self, mock_config, patched_httpx):
         """Test HTTP client setup with proper configuration."""
         mock_http_client = Mock()
-        mock_async_client.return_value = mock_http_client
+        patched_httpx.return_value = mock_http_client
 
         client = APIClient(mock_config)
 
         # Verify AsyncClient was called with correct parameters
-        mock_async_client.assert_called_once()
-        call_args = mock_async_client.call_args
+        patched_httpx.assert_called_once()
+        call_args = patched_httpx.call_args
 
         assert call_args.kwargs['base_url'] == "https://api.test.com"
         assert 'timeout' in call_args.kwargs
         assert 'limits' in call_args.kwargs
+        assert call_args.kwargs['limits'].keepalive_expiry == 75.0
+        assert call_args.kwargs['limits'].max_keepalive_connections == 100
+        assert call_args.kwargs['limits'].max_connections == 1000
         assert call_args.kwargs.get('http1') is True
+        assert call_args.kwargs.get('http2') is True
 
-    @patch('baselog.api.client.tenacity.Retrying')
-    def test_setup_retry_strategy(self, mock_retrying, mock_config):
-        """Test retry strategy setup."""
-        mock_retry_instance = Mock()
-        mock_retrying.return_value = mock_retry_instance
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_http_client_shared_between_instances(self, mock_config, patched_httpx):
+        """Test that clients with the same configuration in one event loop share one HTTP client."""
+        first = APIClient(mock_config)
+        second = APIClient(mock_config)
 
-        client = APIClient(mock_config)
+        patched_httpx.assert_called_once()
+        assert first.client is second.client
 
-        # Verify Retrying was called with exponential backoff
-        mock_retrying.assert_called_once()
-        call_args = mock_retrying.call_args
+    @pytest.mark.unit
+    def test_http_client_private_outside_event_loop(self, mock_config, patched_httpx):
+        """Test that clients created outside an event loop do not share an HTTP client."""
+        patched_httpx.side_effect = lambda **kwargs: AsyncMock(spec=_ASYNC_CLIENT_SPEC)
+        first = APIClient(mock_config)
+        second = APIClient(mock_config)
 
-        assert 'wait' in call_args.kwargs
-        assert call_args.kwargs['wait'].multiplier == mock_config.retry_strategy.backoff_factor
+        assert patched_httpx.call_count == 2
+        assert first.client is not second.client
 
-    def test_client_attributes(self, mock_config):
-        """Test that client has all required attributes."""
-        with patch('baselog.api.client.httpx.AsyncClient'), \
-             patch('baselog.api.client.tenacity.Retrying'):
+    @pytest.mark.slow
+    def test_http_client_not_shared_across_event_loops(self, mock_config, monkeypatch, log_factory):
+        """Test that each event loop drives its own HTTP client over a real transport."""
+        loops_by_client = []
 
-            client = APIClient(mock_config)
+        def make_client(**kwargs):
+            loops = []
+            loops_by_client.append(loops)
 
-            # Test required attributes
-            assert hasattr(client, 'config')
-            assert hasattr(client, 'client')
-            assert hasattr(client, 'retry_strategy')
-            assert client.config is mock_config
-            assert client.client is not None
-            assert client.retry_strategy is not None
+            def handler(request):
+                loops.append(asyncio.get_running_loop())
+                return httpx.Response(201, json=_LOG_RESPONSE_JSON)
 
-    @pytest.mark.asyncio
-    async def test_send_log_successful(self, mock_config):
-        """Test successful log sending."""
-        with patch('baselog.api.client.httpx.AsyncClient') as mock_http_client, \
-             patch('baselog.api.client.tenacity.Retrying') as mock_retrying:
+            return _ASYNC_CLIENT_SPEC(transport=httpx.MockTransport(handler), **kwargs)
 
-            # Setup mocks
-            mock_response = Mock()
-            mock_response.json.return_value = {'id': 'log123', 'status': 'created'}
-            mock_response.headers = {'X-Request-ID': 'req-123'}
+        monkeypatch.setattr(client_module.httpx, 'AsyncClient', make_client)
 
-            # Create async mock for post method
-            mock_post = AsyncMock(return_value=mock_response)
-            mock_http_client.return_value.post = mock_post
-            mock_retrying.return_value = Mock()
+        clients = []
 
-            # Create client
+        async def send_with_new_client():
             client = APIClient(mock_config)
+            clients.append(client)
+            await client.send_log(log_factory())
 
-            # Create test log
-            log = LogModel(level='info', message='Test log message')
-
-            # Call send_log
-            response = await client.send_log(log)
+        # Two loops, with the first client still open when the second is created
+        asyncio.run(send_with_new_client())
+        asyncio.run(send_with_new_client())
+        for client in clients:
+            asyncio.run(client.close())
 
-            # Verify response
-            assert response.success is True
-            assert response.request_id == 'req-123'
-            assert isinstance(response.data, LogResponse)
-            assert response.data.success is True
-            assert response.data.data == {'id': 'log123', 'status': 'created'}
-
-            # Verify HTTP call was made correctly
-            mock_post.assert_called_once()
-            call_args = mock_post.call_args
-            assert call_args.kwargs['json']['message'] == 'Test log message'
-            assert call_args.kwargs['headers']['Content-Type'] == 'application/json'
+        assert len(loops_by_client) == 2
+        for loops in loops_by_client:
+            assert len(loops) == 1
 
     @pytest.mark.asyncio
-    async def test_send_log_with_correlation_id(self, mock_config):
-        """Test log sending with existing correlation ID."""
-        with patch('baselog.api.client.httpx.AsyncClient') as mock_http_client, \
-             patch('baselog.api.client.tenacity.Retrying') as mock_retrying:
+    @pytest.mark.slow
+    async def test_sync_client_http_client_not_shared_with_running_loop(self, mock_config, monkeypatch, log_factory):
+        """Test that a SyncAPIClient made inside a running loop keeps its own HTTP client."""
+        def make_client(**kwargs):
+            handler = lambda request: httpx.Response(201, json=_LOG_RESPONSE_JSON)
+            return _ASYNC_CLIENT_SPEC(transport=httpx.MockTransport(handler), **kwargs)
+
+        monkeypatch.setattr(client_module.httpx, 'AsyncClient', make_client)
+
+        sync_client = SyncAPIClient(mock_config)
+        direct = APIClient(mock_config)
+
+        assert sync_client._async_client.client is not direct.client
+        sync_client.send_log_sync(log_factory())
+        await direct.send_log(log_factory())
+
+        sync_client.close()
+        await direct.close()
+
+    @pytest.mark.unit
+    def test_shared_http_client_registry_drops_closed_loops(self, mock_config, patched_httpx):
+        """Test that the registry does not keep a finished event loop alive."""
+        async def make_client():
+            return APIClient(mock_config)
+
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(make_client())
+        loop.close()
+        loop_ref = weakref.ref(loop)
+        del loop
+        gc.collect()
+        assert loop_ref() is None
+
+        asyncio.run(make_client())
+        assert len(client_module._CLIENTS) == 1
 
-            # Setup mocks
-            mock_response = Mock()
-            mock_response.json.return_value = {'id': 'log123'}
-            mock_response.headers = {'X-Request-ID': 'req-123'}
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_shared_http_client_closed_after_last_release(self, mock_config, patched_httpx):
+        """Test that the shared HTTP client is only closed by its last user."""
+        mock_client_instance = Mock()
+        mock_client_instance.aclose = AsyncMock()
+        patched_httpx.return_value = mock_client_instance
 
-            # Create async mock for post method
-            mock_post = AsyncMock(return_value=mock_response)
-            mock_http_client.return_value.post = mock_post
-            mock_retrying.return_value = Mock()
+        first = APIClient(mock_config)
+        second = APIClient(mock_config)
 
-            client = APIClient(mock_config)
+        await first.close()
+        mock_client_instance.aclose.assert_not_called()
 
-            # Create log with correlation ID
-            log = LogModel(level='error', message='Error message', correlation_id='corr-456')
+        await second.close()
+        mock_client_instance.aclose.assert_called_once()
 
-            response = await client.send_log(log)
+    @pytest.mark.unit
+    def test_client_attributes(self, mock_config):
+        """Test that client has all required attributes."""
+        client = APIClient(mock_config)
 
-            # Verify correlation ID was preserved
-            assert response.data.correlation_id == 'corr-456'
+        # Test required attributes
+        assert hasattr(client, 'config')
+        assert hasattr(client, 'client')
+        assert client.config is mock_config
+        assert client.client is not None
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
-    async def test_send_log_authentication_error(self, mock_config):
-        """Test authentication error handling (401, 403)."""
-        with patch('baselog.api.client.httpx.AsyncClient') as mock_http_client, \
-             patch('baselog.api.client.tenacity.Retrying') as mock_retrying:
-
-            # Setup error response
-            mock_response = Mock()
-            mock_response.status_code = 401
-            mock_http_client.return_value.post.side_effect = Mock()
-            mock_http_client.return_value.post.side_effect = Mock()
-            mock_http_client.return_value.post.side_effect.side_effect = mock_http_client.return_value.post.side_effect
-            mock_http_client.return_value.post.side_effect.side_effect.side_effect = httpx.HTTPStatusError(
-                'Unauthorized', request=Mock(), response=mock_response
-            )
-            mock_retrying.return_value = Mock()
+    async def test_send_log_successful(self, client, fresh_log, response_factory):
+        """Test successful log sending."""
+        # Setup mocks
+        mock_response = response_factory(content=_LOG_RESPONSE_BODY, headers={'X-Request-ID': 'req-123'})
+
+        mock_post = client.client.post
+        mock_post.return_value = mock_response
+
+        # Call send_log
+        response = await client.send_log(fresh_log)
+
+        # Verify response
+        assert response.success is True
+        assert response.request_id == 'req-123'
+        assert isinstance(response.data, LogResponse)
+        assert response.data.success is True
+        assert response.data.data == _LOG_RESPONSE_JSON
+        assert response.data.timestamp == response.timestamp
+
+        # Verify HTTP call was made correctly
+        mock_post.assert_called_once()
+        call_args = mock_post.call_args
+        assert call_args.args[0] == '/projects/logs'
+        assert json.loads(call_args.kwargs['content'])['message'] == 'Test log message'
+        assert call_args.kwargs['headers']['Content-Type'] == 'application/json'
+        assert 'timeout' not in call_args.kwargs
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_send_log_with_correlation_id(self, client, log_factory, response_factory):
+        """Test log sending with existing correlation ID."""
+        # Setup mocks
+        mock_response = response_factory(content=_LOG_RESPONSE_BODY, headers={'X-Request-ID': 'req-123'})
 
-            client = APIClient(mock_config)
+        mock_post = client.client.post
+        mock_post.return_value = mock_response
 
-            log = LogModel(level='info', message='Test message')
+        # Create log with correlation ID
+        log = log_factory(level='error', message='Error message', correlation_id='corr-456')
 
-            # Verify authentication error is raised
-            from baselog.api.exceptions import APIAuthenticationError
-            with pytest.raises(APIAuthenticationError) as exc_info:
-                await client.send_log(log)
+        response = await client.send_log(log)
 
-            assert exc_info.value.status_code == 401
+        # Verify correlation ID was preserved
+        assert response.data.correlation_id == 'corr-456'
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
-    async def test_send_log_rate_limit_error(self, mock_config):
-        """Test rate limiting error handling (429)."""
-        with patch('baselog.api.client.httpx.AsyncClient') as mock_http_client, \
-             patch('baselog.api.client.tenacity.Retrying') as mock_retrying:
-
-            # Setup rate limiting response
-            mock_response = Mock()
-            mock_response.status_code = 429
-            mock_response.headers = {'Retry-After': '30'}
-            mock_http_client.return_value.post.side_effect = httpx.HTTPStatusError(
-                'Too Many Requests', request=Mock(), response=mock_response
-            )
-            mock_retrying.return_value = Mock()
+    @pytest.mark.parametrize('side_effect, exc_cls, match, expected', [
+        (
+            httpx.HTTPStatusError('Unauthorized', request=Mock(), response=Mock(status_code=401)),
+            APIAuthenticationError, None, {'status_code': 401}
+        ),
+        (
+            httpx.HTTPStatusError(
+                'Too Many Requests', request=Mock(), response=Mock(status_code=429, headers={'Retry-After': '30'})
+            ),
+            APIError, None, {'status_code': 429, 'retry_after': 30}
+        ),
+        (httpx.TimeoutException('Request timeout'), APITimeoutError, 'timeout', {}),
+    ], ids=['authentication', 'rate_limit', 'timeout'])
+    @pytest.mark.slow
+    async def test_send_log_http_errors(
+        self, client, log_factory, side_effect, exc_cls, match, expected
+    ):
+        """Test HTTP failures are raised as the matching API error (401, 429, timeout)."""
+        client.client.post = AsyncMock(side_effect=side_effect)
+
+        with pytest.raises(exc_cls, match=match) as exc_info:
+            await client.send_log(log_factory())
+
+        for attr, value in expected.items():
+            assert getattr(exc_info.value, attr) == value
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_send_logs_batch_successful(self, client, log_factory, response_factory):
+        """Test that a batch of logs is sent in a single request."""
+        mock_response = response_factory(content=b'{"created": 2}', headers={'X-Request-ID': 'req-batch'})
 
-            client = APIClient(mock_config)
+        mock_post = AsyncMock(return_value=mock_response)
+        client.client.post = mock_post
 
-            log = LogModel(level='info', message='Test message')
+        logs = [
+            log_factory(message='First message'),
+            log_factory(level='error', message='Second message', category='auth')
+        ]
 
-            # Verify API error with retry after is raised
-            from baselog.api.exceptions import APIError
-            with pytest.raises(APIError) as exc_info:
-                await client.send_log(log)
+        response = await client.send_logs_batch(logs)
 
-            assert exc_info.value.status_code == 429
-            assert exc_info.value.retry_after == 30
+        assert response.success is True
+        assert response.request_id == 'req-batch'
+        assert response.data == {'created': 2}
 
-    @pytest.mark.asyncio
-    async def test_send_log_timeout_error(self, mock_config):
-        """Test timeout error handling."""
-        with patch('baselog.api.client.httpx.AsyncClient') as mock_http_client, \
-             patch('baselog.api.client.tenacity.Retrying') as mock_retrying:
+        mock_post.assert_called_once()
+        call_args = mock_post.call_args
+        assert call_args.args[0] == '/projects/logs/batch'
+        payload = json.loads(call_args.kwargs['content'])['logs']
+        assert [entry['message'] for entry in payload] == ['First message', 'Second message']
+        assert all(log.correlation_id for log in logs)
 
-            mock_http_client.return_value.post.side_effect = httpx.TimeoutException('Request timeout')
-            mock_retrying.return_value = Mock()
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_send_logs_batch_falls_back_on_404(self, client, log_factory, response_factory):
+        """Test that a missing batch endpoint falls back to single log requests."""
+        not_found = response_factory(status_code=404)
+        mock_response = response_factory(content=_LOG_RESPONSE_BODY, headers={'X-Request-ID': 'req-123'})
+
+        mock_post = AsyncMock(side_effect=[
+            httpx.HTTPStatusError('Not Found', request=Mock(), response=not_found),
+            mock_response,
+            mock_response,
+        ])
+        client.client.post = mock_post
+
+        logs = [
+            log_factory(message='First message'),
+            log_factory(message='Second message')
+        ]
+
+        response = await client.send_logs_batch(logs)
+
+        assert response.success is True
+        assert len(response.data) == 2
+        assert mock_post.call_count == 3
+        assert mock_post.call_args.args[0] == '/projects/logs'
+        assert client._batch_supported is False
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_send_logs_individually_reports_first_unsent(self, client, log_factory, response_factory):
+        """Test that a failure part-way through the fallback reports how many logs were sent."""
+        mock_response = response_factory(content=_LOG_RESPONSE_BODY, headers={'X-Request-ID': 'req-123'})
+        client.client.post = AsyncMock(side_effect=[
+            mock_response,
+            httpx.HTTPStatusError('Unauthorized', request=Mock(), response=Mock(status_code=401)),
+        ])
+        client._batch_supported = False
 
-            client = APIClient(mock_config)
+        logs = [log_factory(message=f'Message {i}') for i in range(3)]
 
-            log = LogModel(level='info', message='Test message')
+        with pytest.raises(APIPartialBatchError, match="Sent 1 of 3 logs") as exc_info:
+            await client.send_logs_batch(logs)
 
-            # Verify timeout error is raised
-            from baselog.api.exceptions import APITimeoutError
-            with pytest.raises(APITimeoutError) as exc_info:
-                await client.send_log(log)
+        assert exc_info.value.sent == 1
+        assert isinstance(exc_info.value.original_error, APIAuthenticationError)
+        assert client.client.post.call_count == 2
 
-            assert 'timeout' in str(exc_info.value)
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_send_logs_batch_requires_logs(self, client):
+        """Test that an empty batch is rejected."""
+        with pytest.raises(ValueError, match="At least one LogModel is required"):
+            await client.send_logs_batch([])
 
-    def test_send_log_validation_error(self, mock_config):
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_send_log_validation_error(self, client, fresh_log):
         """Test input validation error."""
-        client = APIClient(mock_config)
-
         # Test with a valid message first
-        valid_log = LogModel(level='info', message='valid message')
-        assert valid_log.message == 'valid message'  # Should not raise error
+        assert fresh_log.message == 'Test log message'  # Should not raise error
 
         # Test what happens when message becomes empty after validation
         # This should not happen with normal LogModel usage, but we test the check
-        log = LogModel(level='info', message='valid message')
+        log = fresh_log
         # Simulate message being cleared (edge case)
         log.message = ''
 
-        with pytest.raises(ValueError) as exc_info:
-            import asyncio
-            asyncio.run(client.send_log(log))
+        with pytest.raises(ValueError, match='Message is required'):
+            await client.send_log(log)
+
+    @pytest.mark.unit
+    def test_request_headers_cached_until_key_rotates(self, mock_config):
+        """Test request headers are reused until the API key changes."""
+        client = APIClient(mock_config)
+
+        headers = client._get_request_headers()
+        assert headers['X-API-Key'] == mock_config.api_key
+        assert headers['Content-Type'] == 'application/json'
+        assert client._get_request_headers() is headers
 
-        assert 'Message is required' in str(exc_info.value)
+        client.auth_manager.api_key = "rotated-api-key-that-is-at-least-16-characters"
+        rotated = client._get_request_headers()
+        assert rotated is not headers
+        assert rotated['X-API-Key'] == "rotated-api-key-that-is-at-least-16-characters"
 
-    def test_generate_correlation_id(self, mock_config):
+    @pytest.mark.unit
+    def test_generate_correlation_id(self, shared_client, monkeypatch):
         """Test correlation ID generation."""
-        client = APIClient(mock_config)
+        # Refill the ID pool from fixed bytes instead of OS randomness
+        monkeypatch.setattr(client_module, '_id_pool', iter(()))
+        monkeypatch.setattr(client_module.os, 'urandom', lambda n: b'\x12' * n)
+
+        correlation_id = shared_client._generate_correlation_id()
 
-        correlation_id = client._generate_correlation_id()
+        assert correlation_id == '12121212-1212-4212-9212-121212121212'
 
         assert isinstance(correlation_id, str)
-        assert len(correlation_id) == 36  # UUID length
-        assert '-' in correlation_id  # UUID format
+        assert uuid.UUID(correlation_id).version == 4  # Raises if malformed
 
-    def test_serialize_log_model(self, mock_config):
-        """Test LogModel serialization."""
+    @pytest.mark.unit
+    def test_generate_correlation_id_unique_across_pool_refill(self, mock_config):
+        """Test pooled correlation IDs stay unique, valid UUID4s across refills."""
         client = APIClient(mock_config)
 
+        ids = [client._generate_correlation_id() for _ in range(client_module._ID_POOL_SIZE + 10)]
+
+        assert len(set(ids)) == len(ids)
+        assert all(uuid.UUID(correlation_id).version == 4 for correlation_id in ids)
+
+    @pytest.mark.unit
+    def test_json_encoding_falls_back_to_stdlib(self, monkeypatch, log_factory):
+        """Test request/response JSON helpers work without orjson installed."""
+        monkeypatch.setattr(client_module, 'orjson', None)
+        log = log_factory(message='test message', tags=['a'])
+
+        body = client_module._json_dumps(log._serialize())
+
+        assert body == b'{"level":"info","message":"test message","tags":["a"]}'
+        assert client_module._json_loads(body)['level'] == 'info'
+
+    @pytest.mark.unit
+    def test_serialize_log_model(self, shared_client, basic_log, log_with_tags):
+        """Test LogModel serialization."""
         # Test basic serialization
-        log = LogModel(level='info', message='test message')
-        result = client._serialize_log_model(log)
+        result = shared_client._serialize_log_model(basic_log)
 
-        assert result['message'] == 'test message'
+        assert result['message'] == 'Test log message'
         assert result['level'] == 'info'
         assert 'category' not in result  # Should not be present when None
         assert 'tags' not in result  # Should not be present when empty
 
         # Test with category and tags
-        log_with_data = LogModel(
-            level='error',
-            message='error message',
-            category='auth',
-            tags=['security', 'login']
-        )
-        result = client._serialize_log_model(log_with_data)
+        result = shared_client._serialize_log_model(log_with_tags)
 
         assert result['category'] == 'auth'
         assert result['tags'] == ['security', 'login']
 
     @pytest.mark.asyncio
-    async def test_send_event_placeholder(self, mock_config):
+    @pytest.mark.unit
+    async def test_send_event_placeholder(self, shared_client, event_factory):
         """Test that send_event returns placeholder response for Phase 1."""
-        with patch('baselog.api.client.httpx.AsyncClient'), \
-             patch('baselog.api.client.tenacity.Retrying'):
+        # Create test event
+        event = event_factory()
 
-            client = APIClient(mock_config)
-
-            # Create test event
-            event = EventModel(
-                event_type="user_action",
-                payload={"action": "click"},
-                timestamp=datetime.now(),
-                source_service="webapp"
-            )
+        # Call send_event
+        response = await shared_client.send_event(event)
 
-            # Call send_event
-            response = await client.send_event(event)
-
-            # Verify placeholder response
-            assert response.success is False
-            assert "Events not supported yet" in response.message
-            assert response.data["event_type"] == "user_action"
-            assert response.data["message"] == "Event submission is reserved for future phases of development"
-            assert response.request_id is None
-            assert response.timestamp is not None
+        # Verify placeholder response
+        assert response.success is False
+        assert "Events not supported yet" in response.message
+        assert response.data["event_type"] == "user_action"
+        assert response.data["message"] == "Event submission is reserved for future phases of development"
+        assert response.request_id is None
+        assert response.timestamp is not None
 
     @pytest.mark.asyncio
-    async def test_send_event_with_event_id(self, mock_config):
+    @pytest.mark.unit
+    async def test_send_event_with_event_id(self, shared_client, event_factory):
         """Test send_event with event_id present."""
-        with patch('baselog.api.client.httpx.AsyncClient'), \
-             patch('baselog.api.client.tenacity.Retrying'):
-
-            client = APIClient(mock_config)
-
-            # Create event with event_id
-            event = EventModel(
-                event_type="system_error",
-                payload={"error": "Database connection failed"},
-                timestamp=datetime.now(),
-                source_service="backend",
-                correlation_id="corr-123"
-            )
-            # Add event_id to test that field
-            event.event_id = "evt-456"
+        # Create event with event_id
+        event = event_factory(
+            event_type="system_error",
+            payload={"error": "Database connection failed"},
+            source_service="backend",
+            correlation_id="corr-123"
+        )
+        # Add event_id to test that field
+        event.event_id = "evt-456"
 
-            response = await client.send_event(event)
+        response = await shared_client.send_event(event)
 
-            # Verify response includes event_id
-            assert response.data["event_type"] == "system_error"
-            assert response.data["event_id"] == "evt-456"
+        # Verify response includes event_id
+        assert response.data["event_type"] == "system_error"
+        assert response.data["event_id"] == "evt-456"
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
-    async def test_send_event_logging(self, mock_config):
+    async def test_send_event_logging(self, mock_config, event_factory):
         """Test that send_event logs appropriate messages."""
-        with patch('baselog.api.client.httpx.AsyncClient'), \
-             patch('baselog.api.client.tenacity.Retrying'):
-
-            client = APIClient(mock_config)
+        client = APIClient(mock_config)
 
-            # Capture logging
-            with patch.object(client.logger, 'warning') as mock_warning, \
-                 patch.object(client.logger, 'info') as mock_info, \
-                 patch.object(client.logger, 'debug') as mock_debug:
+        # Capture logging
+        with patch.object(client.logger, 'warning') as mock_warning, \
+             patch.object(client.logger, 'info') as mock_info, \
+             patch.object(client.logger, 'debug') as mock_debug:
 
-                event = EventModel(
-                    event_type="login_attempt",
-                    payload={"username": "testuser"},
-                    timestamp=datetime.now(),
-                    source_service="auth_service"
-                )
+            event = event_factory(
+                event_type="login_attempt",
+                payload={"username": "testuser"},
+                source_service="auth_service"
+            )
 
-                await client.send_event(event)
+            await client.send_event(event)
 
-                # Verify appropriate logging calls
-                mock_warning.assert_called_once()
-                mock_info.assert_called_once()
-                mock_debug.assert_called_once()
+            # Verify appropriate logging calls
+            mock_warning.assert_called_once()
+            mock_info.assert_called_once()
+            mock_debug.assert_called_once()
 
-                # Check warning message content
-                warning_call = mock_warning.call_args[0][0]
-                assert "Event send attempted for events not currently supported" in warning_call
-                assert "login_attempt" in warning_call
+            # Check warning message content
+            warning_call = mock_warning.call_args[0][0]
+            assert "Event send attempted for events not currently supported" in warning_call
+            assert "login_attempt" in warning_call
 
-                # Check info message content
-                info_call = mock_info.call_args[0][0]
-                assert "Event system planned for future phases" in info_call
-                assert "POST /projects/events" in info_call
+            # Check info message content
+            info_call = mock_info.call_args[0][0]
+            assert "Event system planned for future phases" in info_call
+            assert "POST /projects/events" in info_call
 
-                # Check debug message content
-                debug_call = mock_debug.call_args[0][0]
-                assert "Event validation would occur here" in debug_call
+            # Check debug message content
+            debug_call = mock_debug.call_args[0][0]
+            assert "Event validation would occur here" in debug_call
 
     @pytest.mark.asyncio
-    async def test_send_event_future_readiness(self, mock_config):
+    @pytest.mark.unit
+    async def test_send_event_future_readiness(self, shared_client, event_factory):
         """Test that send_event handles various event structures correctly."""
-        client = APIClient(mock_config)
-
         # Test with minimal event
-        minimal_event = EventModel(
+        minimal_event = event_factory(
             event_type="simple_event",
             payload={"minimal": "data"},
-            timestamp=datetime.now(),
             source_service="test"
         )
 
         # Should not raise exception and return placeholder
-        response = await client.send_event(minimal_event)
+        response = await shared_client.send_event(minimal_event)
 
         assert response.success is False
         assert response.data["event_type"] == "simple_event"
 
     @pytest.mark.asyncio
-    async def test_send_event_with_empty_event_type(self, mock_config):
+    @pytest.mark.unit
+    async def test_send_event_with_empty_event_type(self, shared_client, event_factory):
         """Test send_event with empty event_type field in model validation."""
-        client = APIClient(mock_config)
-
         # Create valid event
-        event = EventModel(
+        event = event_factory(
             event_type="empty_test",  # Must be non-empty due to model validation
             payload={"test": "data"},
-            timestamp=datetime.now(),
             source_service="test"
         )
 
-        response = await client.send_event(event)
+        response = await shared_client.send_event(event)
 
         # Should work and return placeholder
         assert response.success is False
@@ -428,95 +589,93 @@ class TestAPIClient:
         assert response.data["message"] == "Event submission is reserved for future phases of development"
 
     @pytest.mark.asyncio
-    async def test_context_manager_entry(self, mock_config):
+    @pytest.mark.unit
+    async def test_context_manager_entry(self, mock_config, patched_httpx):
         """Test async context manager entry."""
-        with patch('baselog.api.client.httpx.AsyncClient') as mock_async_client, \
-             patch('baselog.api.client.tenacity.Retrying'):
+        mock_client_instance = Mock()
+        patched_httpx.return_value = mock_client_instance
+        mock_client_instance.aclose = AsyncMock()
 
-            mock_client_instance = Mock()
-            mock_async_client.return_value = mock_client_instance
-            mock_client_instance.aclose = AsyncMock()
-
-            async with APIClient(mock_config) as client:
-                assert client is not None
-                assert hasattr(client, 'send_log')
-                assert hasattr(client, 'send_event')
+        async with APIClient(mock_config) as client:
+            assert client is not None
+            assert hasattr(client, 'send_log')
+            assert hasattr(client, 'send_event')
 
     @pytest.mark.asyncio
-    async def test_context_manager_exit_closes_client(self, mock_config):
+    @pytest.mark.unit
+    async def test_context_manager_exit_closes_client(self, mock_config, patched_httpx):
         """Test that context manager exit closes HTTP client."""
-        with patch('baselog.api.client.httpx.AsyncClient') as mock_async_client:
-            mock_client_instance = Mock()
-            mock_async_client.return_value = mock_client_instance
+        mock_client_instance = Mock()
+        patched_httpx.return_value = mock_client_instance
 
-            client = APIClient(mock_config)
+        client = APIClient(mock_config)
 
-            # Mock the aclose method
-            mock_client_instance.aclose = AsyncMock()
+        # Mock the aclose method
+        mock_client_instance.aclose = AsyncMock()
 
-            # Use async context manager
-            async with client:
-                pass
+        # Use async context manager
+        async with client:
+            pass
 
-            # Verify aclose was called
-            mock_client_instance.aclose.assert_called_once()
+        # Verify aclose was called
+        mock_client_instance.aclose.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_explicit_close(self, mock_config):
+    @pytest.mark.unit
+    async def test_explicit_close(self, mock_config, patched_httpx):
         """Test explicit close method."""
-        with patch('baselog.api.client.httpx.AsyncClient') as mock_async_client:
-            mock_client_instance = Mock()
-            mock_async_client.return_value = mock_client_instance
+        mock_client_instance = Mock()
+        patched_httpx.return_value = mock_client_instance
 
-            client = APIClient(mock_config)
+        client = APIClient(mock_config)
 
-            # Mock the aclose method
-            mock_client_instance.aclose = AsyncMock()
+        # Mock the aclose method
+        mock_client_instance.aclose = AsyncMock()
 
-            # Explicitly close
-            await client.close()
+        # Explicitly close
+        await client.close()
 
-            # Verify aclose was called
-            mock_client_instance.aclose.assert_called_once()
+        # Verify aclose was called
+        mock_client_instance.aclose.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_context_manager_closes_on_exception(self, mock_config):
+    @pytest.mark.unit
+    async def test_context_manager_closes_on_exception(self, mock_config, patched_httpx):
         """Test that context manager closes client even when exception is raised."""
-        with patch('baselog.api.client.httpx.AsyncClient') as mock_async_client:
-            mock_client_instance = Mock()
-            mock_async_client.return_value = mock_client_instance
+        mock_client_instance = Mock()
+        patched_httpx.return_value = mock_client_instance
 
-            mock_client_instance.aclose = AsyncMock()
+        mock_client_instance.aclose = AsyncMock()
 
-            # Create client and use context manager that raises exception
-            client = APIClient(mock_config)
+        # Create client and use context manager that raises exception
+        client = APIClient(mock_config)
 
-            try:
-                async with client:
-                    raise ValueError("Test exception")
-            except ValueError:
-                pass  # Expected
+        try:
+            async with client:
+                raise ValueError("Test exception")
+        except ValueError:
+            pass  # Expected
 
-            # Verify aclose was called despite exception
-            mock_client_instance.aclose.assert_called_once()
+        # Verify aclose was called despite exception
+        mock_client_instance.aclose.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_double_close_safe(self, mock_config):
+    @pytest.mark.unit
+    async def test_double_close_safe(self, mock_config, patched_httpx):
         """Test that calling close twice is safe."""
-        with patch('baselog.api.client.httpx.AsyncClient') as mock_async_client:
-            mock_client_instance = Mock()
-            mock_async_client.return_value = mock_client_instance
+        mock_client_instance = Mock()
+        patched_httpx.return_value = mock_client_instance
 
-            client = APIClient(mock_config)
+        client = APIClient(mock_config)
 
-            # Mock the aclose method
-            mock_client_instance.aclose = AsyncMock()
+        # Mock the aclose method
+        mock_client_instance.aclose = AsyncMock()
 
-            # Close first time
-            await client.close()
+        # Close first time
+        await client.close()
 
-            # Close second time (should not raise error)
-            await client.close()
+        # Close second time (should not raise error)
+        await client.close()
 
-            # Verify aclose was called twice (real implementation would handle this gracefully)
-            mock_client_instance.aclose.assert_called()
\ No newline at end of file
+        # Verify the second close was a no-op
+        mock_client_instance.aclose.assert_called_once()
\ No newline at end of file
@@ -2,6 +2,7 @@
 
 import pytest
 import os
+from functools import partial
 from unittest.mock import patch, MagicMock, mock_open
 
 from baselog.helpers import (
@@ -16,6 +17,13 @@ from baselog.logger import Logger
 from baselog.api.config import APIConfig, Timeouts, RetryStrategy, Environment
 from baselog.api.exceptions import ConfigurationError
 
+pytestmark = pytest.mark.unit
+
+# Patchers for the config types _create_config_from_api_key builds on
+_patch_timeouts = partial(patch, 'baselog.api.config.Timeouts')
+_patch_retry_strategy = partial(patch, 'baselog.api.config.RetryStrategy')
+_patch_environment = partial(patch, 'baselog.api.config.Environment')
+
 
 class TestAutoConfigure:
     """Test cases for _auto_configure function."""
@@ -70,9 +78,9 @@ class TestCreateConfigFromApiKey:
         """Test config creation with just API key."""
         api_key = "test_api_key_1234567890123456"
 
-        with patch('baselog.api.config.Timeouts') as mock_timeouts, \
-             patch('baselog.api.config.RetryStrategy') as mock_retry_strategy, \
-             patch('baselog.api.config.Environment') as mock_env:
+        with _patch_timeouts() as mock_timeouts, \
+             _patch_retry_strategy() as mock_retry_strategy, \
+             _patch_environment() as mock_env:
 
             mock_timeouts.from_env.return_value = MagicMock()
             mock_retry_strategy.from_env.return_value = MagicMock()
@@ -89,9 +97,9 @@ class TestCreateConfigFromApiKey:
         base_url = "https://custom.api.com/v1"
         environment = "production"
 
-        with patch('baselog.api.config.Timeouts') as mock_timeouts, \
-             patch('baselog.api.config.RetryStrategy') as mock_retry_strategy, \
-             patch('baselog.api.config.Environment') as mock_env:
+        with _patch_timeouts() as mock_timeouts, \
+             _patch_retry_strategy() as mock_retry_strategy, \
+             _patch_environment() as mock_env:
 
             mock_timeouts.from_env.return_value = MagicMock()
             mock_retry_strategy.from_env.return_value = MagicMock()
@@ -120,7 +128,7 @@ class TestCreateConfigFromApiKey:
 
     def test_create_config_invalid_environment(self):
         """Test config creation with invalid environment."""
-        with patch('baselog.api.config.Environment') as mock_env:
+        with _patch_environment() as mock_env:
             mock_env.side_effect = ValueError("Invalid environment")
 
             with pytest.raises(ConfigurationError, match="Invalid environment"):
@@ -134,9 +142,9 @@ class TestCreateConfigFromApiKey:
             'BASELOG_API_BASE_URL': 'https://env.api.com/v1',
             'BASELOG_ENVIRONMENT': 'staging'
         }):
-            with patch('baselog.api.config.Timeouts') as mock_timeouts, \
-                 patch('baselog.api.config.RetryStrategy') as mock_retry_strategy, \
-                 patch('baselog.api.config.Environment') as mock_env:
+            with _patch_timeouts() as mock_timeouts, \
+                 _patch_retry_strategy() as mock_retry_strategy, \
+                 _patch_environment() as mock_env:
 
                 mock_timeouts.from_env.return_value = MagicMock()
                 mock_retry_strategy.from_env.return_value = MagicMock()
@@ -289,9 +297,9 @@ class TestIntegrationScenarios:
         """Test complete flow of config creation and usage."""
         api_key = "test_api_key_1234567890123456"
 
-        with patch('baselog.api.config.Timeouts') as mock_timeouts, \
-             patch('baselog.api.config.RetryStrategy') as mock_retry_strategy, \
-             patch('baselog.api.config.Environment') as mock_env:
+        with _patch_timeouts() as mock_timeouts, \
+             _patch_retry_strategy() as mock_retry_strategy, \
+             _patch_environment() as mock_env:
 
             mock_timeouts.from_env.return_value = MagicMock()
             mock_retry_strategy.from_env.return_value = MagicMock()
@@ -328,9 +336,9 @@ class TestIntegrationScenarios:
         override_base_url = "https://override.api.com/v1"
 
         with patch.dict(os.environ, {'BASELOG_API_BASE_URL': env_base_url}):
-            with patch('baselog.api.config.Timeouts') as mock_timeouts, \
-                 patch('baselog.api.config.RetryStrategy') as mock_retry_strategy, \
-                 patch('baselog.api.config.Environment') as mock_env:
+            with _patch_timeouts() as mock_timeouts, \
+                 _patch_retry_strategy() as mock_retry_strategy, \
+                 _patch_environment() as mock_env:
 
                 mock_timeouts.from_env.return_value = MagicMock()
                 mock_retry_strategy.from_env.return_value = MagicMock()
@@ -3,10 +3,13 @@ import threading
 import time
 from unittest.mock import patch, MagicMock
 
+import baselog
 from baselog.logger_manager import LoggerManager
 from baselog.logger import Logger, LoggerMode
 from baselog.api.config import APIConfig, Environment, Timeouts, RetryStrategy
 
+pytestmark = pytest.mark.unit
+
 
 class TestLoggerManager:
     """Test suite for LoggerManager singleton class."""
@@ -96,6 +99,23 @@ class TestLoggerManager:
         assert manager._configured is True
         assert logger.is_api_mode()
 
+    def test_configure_closes_replaced_logger(self):
+        """Test reconfiguring stops the previous logger's background sender."""
+        manager = LoggerManager()
+        manager.configure(api_key='test-manual-key-1234567890123456')
+        first = manager.get_logger()
+
+        with patch.object(first, 'close', wraps=first.close) as mock_close:
+            manager.configure(api_key='test-manual-key-1234567890123456')
+            mock_close.assert_called_once_with()
+
+        assert manager.get_logger() is not first
+        assert first.is_local_mode()
+
+        with patch.object(manager.get_logger(), 'close') as mock_close:
+            manager.reset()
+            mock_close.assert_called_once_with()
+
     def test_manual_configuration_with_config(self):
         """Test manual configuration with APIConfig object."""
         manager = LoggerManager()
@@ -342,4 +362,17 @@ class TestLoggerManager:
         # Check that defaults were applied
         config = manager.get_current_config()
         assert config.base_url == 'https://baselog-api.vercel.app'
-        assert config.environment == Environment.DEVELOPMENT
\ No newline at end of file
+        assert config.environment == Environment.DEVELOPMENT
+
+
+class TestPackageLogger:
+    """Test the lazily resolved module-level baselog.logger."""
+
+    def test_module_logger_resolved_on_access(self, reset_package_manager):
+        """Test baselog.logger is created on first access and tracks the manager."""
+        assert baselog._manager._logger is None
+        assert 'logger' in dir(baselog)
+
+        logger = baselog.logger
+        assert isinstance(logger, Logger)
+        assert logger is baselog._manager.get_logger()
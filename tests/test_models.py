@@ -1,7 +1,20 @@
 import pytest
-from datetime import datetime
-from dataclasses import asdict
+from dataclasses import fields
 from baselog.api.models import LogModel, EventModel, LogLevel, LogModelError, InvalidLogLevelError, MissingMessageError
+from constants import FIXED_TS
+
+pytestmark = pytest.mark.unit
+
+# Expected error messages, shared by the pytest.raises(match=...) checks below
+ERR_MSG_REQUIRED = "Message is required"
+ERR_INVALID_LEVEL = r"Invalid log level: '.*'"
+ERR_EVENT_TYPE_REQUIRED = "Event type is required"
+ERR_PAYLOAD_REQUIRED = "Payload is required"
+
+
+def _shallow_dict(obj):
+    """Map a dataclass's field names to its attribute values without deep-copying them."""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
 
 
 def test_logmodel_successful_instantiation():
@@ -22,13 +35,14 @@ def test_logmodel_with_optional_fields():
     assert log.tags == ["tag1", "tag2"]
 
 
-def test_logmodel_missing_message():
-    with pytest.raises(MissingMessageError, match="Message is required"):
-        LogModel(level=LogLevel.INFO, message="")
+@pytest.mark.parametrize("msg", ["", None], ids=["empty", "none"])
+def test_logmodel_missing_message(msg):
+    with pytest.raises(MissingMessageError, match=ERR_MSG_REQUIRED):
+        LogModel(level=LogLevel.INFO, message=msg)
 
 
 def test_loglevel_from_string_rejects_invalid():
-    with pytest.raises(InvalidLogLevelError):
+    with pytest.raises(InvalidLogLevelError, match=ERR_INVALID_LEVEL):
         LogLevel.from_string("invalid")
 
 
@@ -46,19 +60,19 @@ def test_logmodel_runtime_string_coercion():
 
 def test_logmodel_invalid_runtime_string():
     # Test that invalid strings still raise InvalidLogLevelError
-    with pytest.raises(InvalidLogLevelError):
+    with pytest.raises(InvalidLogLevelError, match=ERR_INVALID_LEVEL):
         LogModel(level="invalid", message="Test")
 
 
 def test_logmodel_invalid_non_string_type():
     # Test that non-string, non-LogLevel types raise InvalidLogLevelError
-    with pytest.raises(InvalidLogLevelError):
+    with pytest.raises(InvalidLogLevelError, match=ERR_INVALID_LEVEL):
         LogModel(level=123, message="Test")
 
 
 def test_logmodel_serialization_to_dict():
     log = LogModel(level=LogLevel.INFO, message="Test", category="test_cat", tags=["one"])
-    serialized = asdict(log)
+    serialized = _shallow_dict(log)
     # Since LogLevel is a str-backed enum, it serializes as a string
     expected = {
         "level": "info",
@@ -70,9 +84,16 @@ def test_logmodel_serialization_to_dict():
     assert serialized == expected
 
 
+def test_logmodel_uses_slots():
+    log = LogModel(level=LogLevel.INFO, message="Test")
+    assert not hasattr(log, "__dict__")
+    with pytest.raises(AttributeError):
+        log.unknown_field = "value"
+
+
 def test_logmodel_exclude_optionals_none():
     log = LogModel(level=LogLevel.INFO, message="Test")
-    serialized = asdict(log)
+    serialized = _shallow_dict(log)
     assert "category" in serialized  # Includes None
     assert serialized["category"] is None
     assert "tags" in serialized
@@ -80,46 +101,32 @@ def test_logmodel_exclude_optionals_none():
 
 
 # LogLevel Enum Tests
-def test_loglevel_enum_values():
-    assert LogLevel.DEBUG.value == "debug"
-    assert LogLevel.INFO.value == "info"
-    assert LogLevel.WARNING.value == "warning"
-    assert LogLevel.ERROR.value == "error"
-    assert LogLevel.CRITICAL.value == "critical"
-
-
-def test_loglevel_from_string_valid():
-    assert LogLevel.from_string("debug") == LogLevel.DEBUG
-    assert LogLevel.from_string("INFO") == LogLevel.INFO
-    assert LogLevel.from_string("Warning") == LogLevel.WARNING
-    assert LogLevel.from_string("ERROR") == LogLevel.ERROR
-    assert LogLevel.from_string("critical") == LogLevel.CRITICAL
+@pytest.mark.parametrize("lvl,val", [
+    (LogLevel.DEBUG, "debug"),
+    (LogLevel.INFO, "info"),
+    (LogLevel.WARNING, "warning"),
+    (LogLevel.ERROR, "error"),
+    (LogLevel.CRITICAL, "critical"),
+], ids=["debug", "info", "warning", "error", "critical"])
+def test_loglevel_invariants(lvl, val):
+    assert lvl.value == val
+    assert LogLevel.from_string(val) is lvl
+    assert LogLevel.from_string(val.upper()) is lvl
+    assert LogLevel.from_string(val.capitalize()) is lvl
+    assert lvl in LogLevel
 
 
 def test_loglevel_from_string_invalid():
-    with pytest.raises(InvalidLogLevelError):
+    with pytest.raises(InvalidLogLevelError, match=ERR_INVALID_LEVEL):
         LogLevel.from_string("invalid")
 
-    with pytest.raises(InvalidLogLevelError):
+    with pytest.raises(InvalidLogLevelError, match=ERR_INVALID_LEVEL):
         LogLevel.from_string("unknown")
 
-    with pytest.raises(InvalidLogLevelError):
+    with pytest.raises(InvalidLogLevelError, match=ERR_INVALID_LEVEL):
         LogLevel.from_string("")
 
 
-def test_loglevel_serialization_value():
-    assert LogLevel.INFO.value == "info"
-    assert LogLevel.ERROR.value == "error"
-
-
-def test_loglevel_enum_membership():
-    assert LogLevel.DEBUG in LogLevel
-    assert LogLevel.INFO in LogLevel
-    assert LogLevel.WARNING in LogLevel
-    assert LogLevel.ERROR in LogLevel
-    assert LogLevel.CRITICAL in LogLevel
-
-
 def test_loglevel_string_semantics():
     # Test that LogLevel behaves like a string
     level = LogLevel.INFO
@@ -176,7 +183,7 @@ def test_loglevel_from_string_raises_correct_exception():
 
 
 def test_eventmodel_successful_instantiation():
-    timestamp = datetime.now()
+    timestamp = FIXED_TS
     event = EventModel(
         event_type="user_login",
         payload={"user_id": 123},
@@ -195,7 +202,7 @@ def test_eventmodel_with_optionals():
     event = EventModel(
         event_type="user_login",
         payload={"user_id": 123},
-        timestamp=datetime.now(),
+        timestamp=FIXED_TS,
         source_service="web",
         user_id="user456",
         correlation_id="corr789",
@@ -205,27 +212,27 @@ def test_eventmodel_with_optionals():
 
 
 def test_eventmodel_missing_event_type():
-    with pytest.raises(ValueError, match="Event type is required"):
+    with pytest.raises(ValueError, match=ERR_EVENT_TYPE_REQUIRED):
         EventModel(
             event_type="",
             payload={"test": "data"},
-            timestamp=datetime.now(),
+            timestamp=FIXED_TS,
             source_service="test",
         )
 
 
 def test_eventmodel_empty_payload():
-    with pytest.raises(ValueError, match="Payload is required"):
+    with pytest.raises(ValueError, match=ERR_PAYLOAD_REQUIRED):
         EventModel(
             event_type="test_event",
             payload={},
-            timestamp=datetime.now(),
+            timestamp=FIXED_TS,
             source_service="test",
         )
 
 
 def test_eventmodel_serialization_to_dict():
-    timestamp = datetime.now()
+    timestamp = FIXED_TS
     event = EventModel(
         event_type="test_event",
         payload={"key": "value"},
@@ -240,4 +247,4 @@ def test_eventmodel_serialization_to_dict():
         "user_id": None,
         "correlation_id": None,
     }
-    assert asdict(event) == expected
+    assert _shallow_dict(event) == expected
@@ -2,6 +2,8 @@ import pytest
 from unittest.mock import Mock, MagicMock
 from baselog.api.responses import APIResponse, APIError, LogResponse
 
+pytestmark = pytest.mark.unit
+
 def test_apiresponse_from_success_response_valid():
     mock_response = MagicMock()
     mock_json = {